@@ -1,13 +1,19 @@
+import json
 import os
 from datetime import datetime
 
+import click
 from dotenv import load_dotenv
 from flask import Flask
 
-from db import init_db, seed_defaults
+from db import IS_VERCEL, init_db, seed_defaults
 from routes.admin import admin
 from routes.site import site
-from site_data import COMPANY, USFA
+from site_data import COMPANY, SEED_IMAGE_META, USFA
+import caching
+import image_meta
+import snapshot
+import uploads
 
 load_dotenv()
 
@@ -15,17 +21,64 @@ load_dotenv()
 def create_app() -> Flask:
     app = Flask(__name__)
     app.secret_key = os.getenv("SECRET_KEY", "change-me-in-production")
+    # Offload upload bytes to a front proxy: Apache/lighttpd via X-Sendfile,
+    # or nginx via X-Accel-Redirect to an internal location (e.g. "/_uploads").
+    app.config["USE_X_SENDFILE"] = os.getenv("USE_X_SENDFILE") == "1"
+    app.config["UPLOAD_ACCEL_REDIRECT"] = os.getenv("UPLOAD_ACCEL_REDIRECT", "")
+    # Serve public pages from an in-memory snapshot (see snapshot.py).
+    app.config["CONTENT_SNAPSHOT"] = os.getenv("CONTENT_SNAPSHOT") == "1"
+    app.config["CONTENT_SNAPSHOT_POLL"] = float(os.getenv("CONTENT_SNAPSHOT_POLL", snapshot.DEFAULT_POLL_INTERVAL))
 
+    caching.init_app(app)
     app.register_blueprint(site)
     app.register_blueprint(admin)
 
     init_db()
     seed_defaults()
+    # Seeded rows carry precomputed metadata (site_data.SEED_IMAGE_META);
+    # pre-existing images and pasted links get theirs computed once here.
+    # Not on Vercel: the database is reseeded on every cold start and the
+    # thread would be frozen between invocations.
+    if not IS_VERCEL:
+        image_meta.backfill_in_background()
+    if app.config["CONTENT_SNAPSHOT"]:
+        def purge_content():
+            with app.app_context():
+                caching.purge("projects", "listings")
+
+        snapshot.start(app.config["CONTENT_SNAPSHOT_POLL"], on_change=purge_content)
 
     @app.context_processor
     def inject_globals():
         return {"company": COMPANY, "year": datetime.now().year, "usfa": USFA}
 
+    @app.cli.command("sweep-uploads")
+    @click.option("--grace-hours", default=uploads.GRACE_PERIOD / 3600, show_default=True,
+                  help="Keep unreferenced uploads at least this long.")
+    @click.option("--rescan", is_flag=True, help="First register files on disk missing from the index.")
+    def sweep_uploads(grace_hours: float, rescan: bool):
+        """Delete uploaded images no project or listing references any more."""
+        if rescan:
+            click.echo(f"Registered {uploads.rescan()} untracked file(s).")
+        removed, freed = uploads.sweep(grace_hours * 3600)
+        click.echo(f"Removed {removed} file(s), freed {freed} bytes.")
+
+    @app.cli.command("image-meta")
+    @click.option("--retry-failed", is_flag=True, help="Also retry images that could not be described before.")
+    @click.option("--seed", is_flag=True, help="Instead print entries for site_data.SEED_IMAGE_META.")
+    def image_meta_command(retry_failed: bool, seed: bool):
+        """Compute size and placeholder for stored images that lack them."""
+        if not image_meta.available():
+            raise click.ClickException("Pillow is not installed.")
+        if seed:
+            for url in SEED_IMAGE_META:
+                info = image_meta.describe_url(url)
+                if info is None:
+                    raise click.ClickException(f"Could not describe {url}")
+                click.echo(f"    {json.dumps(url)}: {json.dumps(info)},")
+            return
+        click.echo(f"Described {image_meta.backfill(retry_failed)} image(s).")
+
     return app
 
 
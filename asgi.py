@@ -0,0 +1,240 @@
+"""ASGI entry point, e.g. ``uvicorn asgi:app --workers 2``.
+
+The request body (image uploads, the contact form) is read on the event loop
+and spooled to a temporary file before Flask sees it, so a slow client does
+not hold a thread while it trickles bytes in. The Flask app then runs on a
+dedicated thread pool; its output is queued to the loop without waiting for
+the client, so a slow download does not hold a thread either. File bodies
+(uploads) are sent by the loop straight from the file.
+The WSGI entry point in app.py is unchanged and still used on Vercel.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+
+from werkzeug.wsgi import FileWrapper
+
+from app import app as wsgi_app
+
+WORKERS = int(os.getenv("ASGI_WORKERS", "16"))
+BODY_SPOOL_SIZE = 64 * 1024
+FILE_CHUNK_SIZE = 64 * 1024
+
+_executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="wsgi")
+
+
+def _build_environ(scope: dict, body, body_size: int) -> dict:
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope["query_string"].decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        "wsgi.input_terminated": True,  # fully buffered, so chunked bodies are readable too
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope["headers"]:
+        name = raw_name.decode("latin-1").lower()
+        value = raw_value.decode("latin-1")
+        if name == "content-length":
+            key = "CONTENT_LENGTH"
+        elif name == "content-type":
+            key = "CONTENT_TYPE"
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    # The body is already buffered, so its real size replaces whatever the
+    # client announced (or the missing header on a chunked request).
+    environ["CONTENT_LENGTH"] = str(body_size)
+    return environ
+
+
+class _FileBody:
+    """A file response handed from the app thread to the event loop to send."""
+
+    def __init__(self, result, file, offset: int, length: int):
+        self.result = result  # closed, with the file, once sent
+        self.file = file
+        self.offset = offset
+        self.length = length
+
+
+def _file_range(status: int, headers: list, file) -> tuple[int, int] | None:
+    """Return (offset, length) of a file body from the response headers, or None."""
+    values = dict(headers)
+    try:
+        if status == 206:
+            unit, _, spec = values.get(b"content-range", b"").decode("latin-1").partition(" ")
+            start, _, end = spec.partition("/")[0].partition("-")
+            if unit != "bytes":
+                return None
+            return int(start), int(end) - int(start) + 1
+        if status == 200:
+            return file.tell(), int(values[b"content-length"])
+    except (KeyError, ValueError):
+        return None
+    return None
+
+
+def _has_fileno(file) -> bool:
+    try:
+        file.fileno()
+    except (AttributeError, OSError):
+        return False
+    return True
+
+
+def _run_wsgi(scope: dict, body, body_size: int, put) -> None:
+    """Run the Flask app in a pool thread, handing its output to the loop through `put`.
+
+    `put` never blocks, so the thread is released as soon as the app has
+    produced its response, however slowly the client reads it. Bodies served
+    through wsgi.file_wrapper (send_file, send_from_directory) are not read
+    here at all: the loop sends them from the file.
+    """
+    response_start = {}
+    started = False
+    wrapped = []
+
+    def file_wrapper(file, block_size: int = 8192):
+        wrapper = FileWrapper(file, block_size)
+        wrapped.append(wrapper)
+        return wrapper
+
+    def write(chunk: bytes) -> None:
+        nonlocal started
+        if not started:
+            put(response_start)
+            started = True
+        if chunk:
+            put({"type": "http.response.body", "body": chunk, "more_body": True})
+
+    def start_response(status: str, headers: list, exc_info=None):
+        if exc_info and started:
+            raise exc_info[1].with_traceback(exc_info[2])
+        response_start.update(
+            type="http.response.start",
+            status=int(status.split(" ", 1)[0]),
+            headers=[(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+        )
+        return write
+
+    environ = _build_environ(scope, body, body_size)
+    environ["wsgi.file_wrapper"] = file_wrapper
+    result = wsgi_app(environ, start_response)
+
+    # A file body is either the wrapper itself or a range of it (206).
+    if wrapped and not started and scope["method"] != "HEAD" and (
+        result is wrapped[-1] or response_start["status"] == 206
+    ):
+        file = wrapped[-1].file
+        span = _file_range(response_start["status"], response_start["headers"], file)
+        if span is not None and _has_fileno(file):
+            put(response_start)
+            put(_FileBody(result, file, *span))
+            return
+
+    try:
+        for chunk in result:
+            write(chunk)
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+    if not started:
+        put(response_start)
+    put({"type": "http.response.body"})
+
+
+async def _send_file(scope: dict, send, body: _FileBody) -> None:
+    """Send a file body from the loop: via http.response.pathsend when the
+    server supports it, else in chunks read on the default executor."""
+    loop = asyncio.get_running_loop()
+    try:
+        fd = body.file.fileno()
+        whole = body.offset == 0 and body.length == os.fstat(fd).st_size
+        if whole and "http.response.pathsend" in scope.get("extensions", {}):
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(body.file.name)})
+            return
+        offset, end = body.offset, body.offset + body.length
+        while offset < end:
+            chunk = await loop.run_in_executor(None, os.pread, fd, min(FILE_CHUNK_SIZE, end - offset), offset)
+            if not chunk:
+                break
+            offset += len(chunk)
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body"})
+    finally:
+        if hasattr(body.result, "close"):
+            body.result.close()
+
+
+async def _lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            _executor.shutdown(wait=True)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope: dict, receive, send) -> None:
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+    with SpooledTemporaryFile(max_size=BODY_SPOOL_SIZE) as body:
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body.write(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        body_size = body.tell()
+        body.seek(0)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def put(message) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+
+        def run() -> None:
+            try:
+                _run_wsgi(scope, body, body_size, put)
+            finally:
+                put(None)
+
+        worker = loop.run_in_executor(_executor, run)
+        try:
+            while (message := await queue.get()) is not None:
+                if isinstance(message, _FileBody):
+                    await _send_file(scope, send, message)
+                else:
+                    await send(message)
+        finally:
+            await worker
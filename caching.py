@@ -0,0 +1,146 @@
+"""HTTP caching policy for public pages and edge purging on admin writes.
+
+Views declare their policy with @cache_policy; the site blueprint applies it
+to successful GET/HEAD responses. Each cached page is tagged with surrogate
+keys, and admin writes call purge() with the keys they invalidate. The
+purger is pluggable: configure CACHE_PURGE_URL for a webhook, or install a
+LocalPurger (records keys in memory) in tests. With no purger configured,
+pages are only cached by browsers (max-age): an edge copy could otherwise
+hide admin edits until its s-maxage ran out.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import urllib.request
+from dataclasses import dataclass, replace
+
+from flask import Flask, Response, current_app, request
+
+SURROGATE_KEY_HEADER = "Surrogate-Key"
+NO_STORE = "private, no-store"
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    max_age: int = 0  # browsers
+    s_maxage: int | None = None  # shared caches / CDN edge
+    stale_while_revalidate: int | None = None
+    surrogate_keys: tuple[str, ...] = ()
+
+    def cache_control(self) -> str:
+        parts = ["public", f"max-age={self.max_age}"]
+        if self.s_maxage is not None:
+            parts.append(f"s-maxage={self.s_maxage}")
+        if self.stale_while_revalidate is not None:
+            parts.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(parts)
+
+
+def cache_policy(**kwargs):
+    """Attach a CachePolicy to a view. Place it below the route decorator."""
+    policy = CachePolicy(**kwargs)
+
+    def decorator(view):
+        view.cache_policy = policy
+        return view
+    return decorator
+
+
+def apply_policy(response: Response) -> Response:
+    """after_request hook: emit the current view's policy, or no-store for anything unsafe to share."""
+    if "Cache-Control" in response.headers:
+        return response  # the view set its own (e.g. uploads)
+
+    view = current_app.view_functions.get(request.endpoint)
+    policy = getattr(view, "cache_policy", None)
+    cacheable = (
+        policy is not None
+        and request.method in ("GET", "HEAD")
+        and response.status_code == 200
+        # Visitors with a session cookie (e.g. a logged-in admin) stay private.
+        # The cookie is checked rather than `session`, whose access would add
+        # Vary: Cookie and split the shared cache by every visitor's cookies.
+        and not request.cookies.get(current_app.config["SESSION_COOKIE_NAME"])
+    )
+    if not cacheable:
+        response.headers["Cache-Control"] = NO_STORE
+        return response
+
+    if isinstance(current_app.extensions["cache_purger"], NullPurger):
+        policy = replace(policy, s_maxage=None, stale_while_revalidate=None, surrogate_keys=())
+    response.headers["Cache-Control"] = policy.cache_control()
+    if policy.surrogate_keys:
+        response.headers[SURROGATE_KEY_HEADER] = " ".join(policy.surrogate_keys)
+    return response
+
+
+def no_store(response: Response) -> Response:
+    response.headers["Cache-Control"] = NO_STORE
+    return response
+
+
+# ── Purging ───────────────────────────────────────────────────────────────────
+
+class NullPurger:
+    """Default when no CDN purge endpoint is configured."""
+
+    def purge(self, keys: list[str]) -> None:
+        pass
+
+
+class LocalPurger:
+    """Records purged keys instead of calling out; for tests and local runs."""
+
+    def __init__(self):
+        self.purged: list[str] = []
+
+    def purge(self, keys: list[str]) -> None:
+        self.purged.extend(keys)
+
+
+class WebhookPurger:
+    """POSTs {"keys": [...]} to a purge endpoint, with an optional bearer token."""
+
+    def __init__(self, url: str, token: str = "", timeout: float = 5.0):
+        self.url = url
+        self.token = token
+        self.timeout = timeout
+
+    def purge(self, keys: list[str]) -> None:
+        req = urllib.request.Request(
+            self.url,
+            data=json.dumps({"keys": keys}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        if self.token:
+            req.add_header("Authorization", f"Bearer {self.token}")
+        with urllib.request.urlopen(req, timeout=self.timeout):
+            pass
+
+
+def init_app(app: Flask) -> None:
+    if "cache_purger" in app.extensions:
+        return
+    url = os.getenv("CACHE_PURGE_URL", "")
+    if url:
+        app.extensions["cache_purger"] = WebhookPurger(url, os.getenv("CACHE_PURGE_TOKEN", ""))
+    else:
+        app.extensions["cache_purger"] = NullPurger()
+        log.info("CACHE_PURGE_URL not set; public pages will not be cached at the edge")
+
+
+def purge(*keys: str) -> None:
+    """Invalidate every cached page tagged with any of `keys`.
+
+    A failed purge is logged rather than raised: the write it follows has
+    already been committed, and the page will expire on its own.
+    """
+    try:
+        current_app.extensions["cache_purger"].purge(list(keys))
+    except Exception:
+        log.exception("Cache purge failed for %s", ", ".join(keys))
@@ -3,16 +3,123 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import time
+from collections.abc import Iterator
 from contextlib import contextmanager
 
 IS_VERCEL = bool(os.getenv("VERCEL"))
 DB_PATH = "/tmp/database.db" if IS_VERCEL else os.path.join(os.path.dirname(__file__), "database.db")
 
+PROJECT_COLUMNS = ("title", "location", "goal", "solution", "materials")
+LISTING_COLUMNS = (
+    "listing_type", "place", "title", "rooms", "floor",
+    "price_chf", "price_label", "description", "bullets",
+)
+_JSON_COLUMNS = {"bullets", "images"}
+UPLOAD_URL_PREFIX = "/uploads/"  # must match the site.upload route
+
+
+class StaleVersionError(Exception):
+    """Raised when a patch targets a row that changed since it was read."""
+
 
 def _row_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
     return {col[0]: row[i] for i, col in enumerate(cursor.description)}
 
 
+# ── Row models ────────────────────────────────────────────────────────────────
+
+class _Row:
+    """Compact read-only view of one row.
+
+    JSON columns are kept as the raw string until first accessed. Item access
+    (`row["title"]`) is supported alongside attributes so existing callers and
+    templates keep working.
+    """
+
+    __slots__ = ()
+    _json_fields: tuple[str, ...] = ()
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def keys(self) -> list[str]:
+        return [slot.lstrip("_") for slot in self.__slots__]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, title={self.title!r})"
+
+    @classmethod
+    def _builder(cls, description):
+        """Resolve the cursor's columns to slots once and return a per-row constructor."""
+        fields = set(cls.__slots__)
+        setters = []
+        for index, col in enumerate(description):
+            name = col[0]
+            slot = f"_{name}" if name in cls._json_fields else name
+            if slot in fields:
+                setters.append((index, getattr(cls, slot).__set__))
+                fields.discard(slot)
+        defaults = [getattr(cls, slot).__set__ for slot in fields]
+        new = object.__new__
+
+        def build(row: tuple):
+            obj = new(cls)
+            for index, set_ in setters:
+                set_(obj, row[index])
+            for set_ in defaults:
+                set_(obj, None)
+            return obj
+
+        return build
+
+
+def _json_field(slot: str, empty: str = "[]") -> property:
+    def fget(self):
+        value = getattr(self, slot)
+        if value is None or isinstance(value, str):
+            value = json.loads(value or empty)
+            setattr(self, slot, value)
+        return value
+    return property(fget)
+
+
+class ProjectRow(_Row):
+    __slots__ = (
+        "id", "title", "location", "goal", "solution", "materials", "image", "_images", "_image_meta",
+        "created_at", "version",
+    )
+    _json_fields = ("images", "image_meta")
+    images = _json_field("_images")
+    image_meta = _json_field("_image_meta", "{}")
+
+
+class ListingRow(_Row):
+    __slots__ = (
+        "id", "listing_type", "place", "title", "rooms", "floor", "price_chf", "price_label",
+        "description", "_bullets", "_images", "_image_meta", "created_at", "version",
+    )
+    _json_fields = ("bullets", "images", "image_meta")
+    bullets = _json_field("_bullets")
+    images = _json_field("_images")
+    image_meta = _json_field("_image_meta", "{}")
+
+
+def _query(conn: sqlite3.Connection, cls: type[_Row], sql: str, params: tuple = ()) -> Iterator:
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(sql, params)
+    build = cls._builder(cur.description)
+    for row in cur:
+        yield build(row)
+
+
 @contextmanager
 def get_db():
     conn = sqlite3.connect(DB_PATH)
@@ -58,12 +165,50 @@ def init_db():
                 images        TEXT    DEFAULT '[]',
                 created_at    TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
+
+            -- Every file written to the uploads folder; orphaned_at is set
+            -- while nothing references it and cleared once something does.
+            CREATE TABLE IF NOT EXISTS uploads (
+                name         TEXT    PRIMARY KEY,
+                size         INTEGER NOT NULL DEFAULT 0,
+                orphaned_at  REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_uploads_orphaned ON uploads(orphaned_at);
+
+            -- Which rows point at which upload (reference index).
+            CREATE TABLE IF NOT EXISTS upload_refs (
+                name        TEXT    NOT NULL,
+                table_name  TEXT    NOT NULL,
+                row_id      INTEGER NOT NULL,
+                PRIMARY KEY (name, table_name, row_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_upload_refs_row ON upload_refs(table_name, row_id);
+
+            -- Bumped by every write to projects/real_estate; snapshot readers
+            -- poll it to know when to rebuild.
+            CREATE TABLE IF NOT EXISTS content_changes (
+                id       INTEGER PRIMARY KEY CHECK (id = 1),
+                counter  INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO content_changes (id, counter) VALUES (1, 0);
         """)
         # Migration: add images column to projects if it doesn't exist yet
         try:
             conn.execute("ALTER TABLE projects ADD COLUMN images TEXT DEFAULT '[]'")
         except sqlite3.OperationalError:
             pass
+        # Migration: row version used for optimistic locking of admin edits
+        for table in ("projects", "real_estate"):
+            try:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            except sqlite3.OperationalError:
+                pass
+        # Migration: per-image size and placeholder, keyed by image URL
+        for table in ("projects", "real_estate"):
+            try:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN image_meta TEXT DEFAULT '{{}}'")
+            except sqlite3.OperationalError:
+                pass
         # Migrate old single image into images array for rows that still have image but empty images
         rows = conn.execute("SELECT id, image, images FROM projects WHERE image != '' AND (images IS NULL OR images = '[]')").fetchall()
         for row in rows:
@@ -71,112 +216,347 @@ def init_db():
                 "UPDATE projects SET images = ? WHERE id = ?",
                 (json.dumps([row["image"]], ensure_ascii=False), row["id"]),
             )
+        # Migration: uploads are served by /uploads/<name> instead of the static route
+        for table in ("projects", "real_estate"):
+            conn.execute(
+                f"""UPDATE {table} SET images = REPLACE(images, '"/static/uploads/', '"/uploads/')
+                    WHERE images LIKE '%"/static/uploads/%'"""
+            )
+        # Backfill the reference index for databases created before it existed
+        if conn.execute("SELECT COUNT(*) AS c FROM upload_refs").fetchone()["c"] == 0:
+            for table in ("projects", "real_estate"):
+                for row in conn.execute(f"SELECT id, images FROM {table}").fetchall():
+                    _sync_refs(conn, table, row["id"], json.loads(row["images"] or "[]"))
 
 
 # ── Projects ──────────────────────────────────────────────────────────────────
 
-def get_projects() -> list[dict]:
+def get_projects() -> list[ProjectRow]:
     with get_db() as conn:
-        rows = conn.execute("SELECT * FROM projects ORDER BY created_at DESC").fetchall()
-    for row in rows:
-        row["images"] = json.loads(row.get("images") or "[]")
-    return rows
+        return list(_query(conn, ProjectRow, "SELECT * FROM projects ORDER BY created_at DESC"))
+
+
+def iter_projects() -> Iterator[ProjectRow]:
+    """Yield projects newest first, one row at a time, for streamed rendering."""
+    with get_db() as conn:
+        yield from _query(conn, ProjectRow, "SELECT * FROM projects ORDER BY created_at DESC")
 
 
-def get_project(project_id: int) -> dict | None:
+def get_project(project_id: int) -> ProjectRow | None:
     with get_db() as conn:
-        row = conn.execute("SELECT * FROM projects WHERE id = ?", (project_id,)).fetchone()
-    if row:
-        row["images"] = json.loads(row.get("images") or "[]")
-    return row
+        return next(_query(conn, ProjectRow, "SELECT * FROM projects WHERE id = ?", (project_id,)), None)
 
 
-def create_project(title: str, location: str, goal: str, solution: str, materials: str, images: list[str] | None = None) -> int:
+def create_project(
+    title: str, location: str, goal: str, solution: str, materials: str,
+    images: list[str] | None = None, image_meta: dict | None = None,
+) -> int:
     imgs = images or []
     with get_db() as conn:
         cur = conn.execute(
-            "INSERT INTO projects (title, location, goal, solution, materials, images) VALUES (?, ?, ?, ?, ?, ?)",
-            (title, location, goal, solution, materials, json.dumps(imgs, ensure_ascii=False)),
+            "INSERT INTO projects (title, location, goal, solution, materials, images, image_meta) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (title, location, goal, solution, materials, json.dumps(imgs, ensure_ascii=False),
+             json.dumps(image_meta or {})),
         )
+        _sync_refs(conn, "projects", cur.lastrowid, imgs)
+        _bump_content(conn)
         return cur.lastrowid
 
 
-def update_project(project_id: int, title: str, location: str, goal: str, solution: str, materials: str, images: list[str] | None = None) -> None:
-    imgs = images or []
-    with get_db() as conn:
-        conn.execute(
-            "UPDATE projects SET title=?, location=?, goal=?, solution=?, materials=?, images=? WHERE id=?",
-            (title, location, goal, solution, materials, json.dumps(imgs, ensure_ascii=False), project_id),
-        )
+def patch_project(
+    project_id: int, version: int, fields: dict,
+    prepend_images: list[str] | None = None, append_images: list[str] | None = None,
+    remove_images: list[str] | None = None, image_meta: dict | None = None,
+    order: list[str] | None = None,
+) -> bool:
+    """Apply an admin edit to a project; returns False if the project does not exist."""
+    return _patch("projects", PROJECT_COLUMNS, project_id, version, fields,
+                  prepend_images, append_images, remove_images, image_meta, order)
 
 
 def delete_project(project_id: int) -> None:
     with get_db() as conn:
         conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+        _sync_refs(conn, "projects", project_id, [])
+        _bump_content(conn)
 
 
 # ── Real Estate ───────────────────────────────────────────────────────────────
 
-def get_listings() -> list[dict]:
+def get_listings() -> list[ListingRow]:
     with get_db() as conn:
-        rows = conn.execute("SELECT * FROM real_estate ORDER BY listing_type, created_at DESC").fetchall()
-    for row in rows:
-        row["bullets"] = json.loads(row.get("bullets") or "[]")
-        row["images"] = json.loads(row.get("images") or "[]")
-    return rows
+        return list(_query(conn, ListingRow, "SELECT * FROM real_estate ORDER BY listing_type, created_at DESC"))
+
+
+def stream_listings(listing_types: tuple[str, ...]) -> tuple[dict[str, int], list[Iterator[ListingRow]]]:
+    """Return per-type counts and one newest-first row stream per type, for streamed rendering.
+
+    Everything is read from one connection and read transaction, so the counts
+    always match the rows that follow. The streams share that connection and
+    must be consumed in order; one that is never iterated is skipped.
+    """
+    stream = _listing_stream(listing_types)
+    counts = next(stream)
+    position = [0]  # index of the type the stream is currently on
+
+    def section(index: int) -> Iterator[ListingRow]:
+        while position[0] < index:
+            for row in stream:  # skip an earlier type nobody iterated
+                if row is None:
+                    break
+            position[0] += 1
+        for row in stream:
+            if row is None:
+                break
+            yield row
+        position[0] += 1
+
+    return counts, [section(i) for i in range(len(listing_types))]
 
 
-def get_listing(listing_id: int) -> dict | None:
+def _listing_stream(listing_types: tuple[str, ...]) -> Iterator:
+    """Yield the counts, then each type's rows, with None between types."""
     with get_db() as conn:
-        row = conn.execute("SELECT * FROM real_estate WHERE id = ?", (listing_id,)).fetchone()
-    if row:
-        row["bullets"] = json.loads(row.get("bullets") or "[]")
-        row["images"] = json.loads(row.get("images") or "[]")
-    return row
+        conn.execute("BEGIN")
+        rows = conn.execute("SELECT listing_type, COUNT(*) AS c FROM real_estate GROUP BY listing_type").fetchall()
+        found = {row["listing_type"]: row["c"] for row in rows}
+        yield {t: found.get(t, 0) for t in listing_types}
+        for i, listing_type in enumerate(listing_types):
+            if i:
+                yield None
+            yield from _query(
+                conn, ListingRow,
+                "SELECT * FROM real_estate WHERE listing_type = ? ORDER BY created_at DESC",
+                (listing_type,),
+            )
+
+
+def get_listing(listing_id: int) -> ListingRow | None:
+    with get_db() as conn:
+        return next(_query(conn, ListingRow, "SELECT * FROM real_estate WHERE id = ?", (listing_id,)), None)
 
 
 def create_listing(
     listing_type: str, place: str, title: str, rooms: str, floor: str,
     price_chf: int, price_label: str, description: str,
-    bullets: list[str], images: list[str],
+    bullets: list[str], images: list[str], image_meta: dict | None = None,
 ) -> int:
     with get_db() as conn:
         cur = conn.execute(
             """INSERT INTO real_estate
-               (listing_type, place, title, rooms, floor, price_chf, price_label, description, bullets, images)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+               (listing_type, place, title, rooms, floor, price_chf, price_label, description, bullets, images, image_meta)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
             (listing_type, place, title, rooms, floor, price_chf, price_label, description,
-             json.dumps(bullets, ensure_ascii=False), json.dumps(images, ensure_ascii=False)),
+             json.dumps(bullets, ensure_ascii=False), json.dumps(images, ensure_ascii=False),
+             json.dumps(image_meta or {})),
         )
+        _sync_refs(conn, "real_estate", cur.lastrowid, images)
+        _bump_content(conn)
         return cur.lastrowid
 
 
-def update_listing(
-    listing_id: int, listing_type: str, place: str, title: str, rooms: str,
-    floor: str, price_chf: int, price_label: str, description: str,
-    bullets: list[str], images: list[str],
-) -> None:
+def patch_listing(
+    listing_id: int, version: int, fields: dict,
+    prepend_images: list[str] | None = None, append_images: list[str] | None = None,
+    remove_images: list[str] | None = None, image_meta: dict | None = None,
+    order: list[str] | None = None,
+) -> bool:
+    """Apply an admin edit to a listing; returns False if the listing does not exist."""
+    return _patch("real_estate", LISTING_COLUMNS, listing_id, version, fields,
+                  prepend_images, append_images, remove_images, image_meta, order)
+
+
+def delete_listing(listing_id: int) -> None:
     with get_db() as conn:
+        conn.execute("DELETE FROM real_estate WHERE id = ?", (listing_id,))
+        _sync_refs(conn, "real_estate", listing_id, [])
+        _bump_content(conn)
+
+
+# ── Patches ───────────────────────────────────────────────────────────────────
+
+def _patch(
+    table: str, columns: tuple[str, ...], row_id: int, version: int, fields: dict,
+    prepend_images, append_images, remove_images, image_meta, order,
+) -> bool:
+    """Read, diff and write one row in a single transaction.
+
+    Only columns whose value actually changed are written. `order`, if given,
+    must be a permutation of the stored images and is applied before the
+    prepend/append/remove operations. `image_meta` holds entries for newly
+    added images; entries for removed images are dropped. Raises
+    StaleVersionError if the row's version no longer matches `version`, and
+    ValueError if `order` is not a permutation of the stored images.
+    """
+    with get_db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            f"SELECT {', '.join(columns)}, images, image_meta, version FROM {table} WHERE id = ?", (row_id,)
+        ).fetchone()
+        if row is None:
+            return False
+        if row["version"] != version:
+            raise StaleVersionError(f"{table} #{row_id} is at version {row['version']}, not {version}")
+
+        changes = {}
+        for col in columns:
+            if col not in fields:
+                continue
+            value = json.dumps(fields[col], ensure_ascii=False) if col in _JSON_COLUMNS else fields[col]
+            if value != row[col]:
+                changes[col] = value
+
+        images = json.loads(row["images"] or "[]")
+        if order is not None and sorted(order) != sorted(images):
+            raise ValueError(f"{table} #{row_id}: image order is not a permutation of the stored images")
+        if order is not None or prepend_images or append_images or remove_images:
+            removed = set(remove_images or [])
+            current = order if order is not None else images
+            patched = [img for img in [*(prepend_images or []), *current, *(append_images or [])] if img not in removed]
+            if patched != images:
+                changes["images"] = json.dumps(patched, ensure_ascii=False)
+                _sync_refs(conn, table, row_id, patched)
+                meta = {**json.loads(row["image_meta"] or "{}"), **(image_meta or {})}
+                changes["image_meta"] = json.dumps({url: meta[url] for url in patched if url in meta})
+
+        if changes:
+            assignments = ", ".join(f"{col}=?" for col in changes)
+            conn.execute(
+                f"UPDATE {table} SET {assignments}, version=version+1 WHERE id=?",
+                (*changes.values(), row_id),
+            )
+            _bump_content(conn)
+        return True
+
+
+# ── Image metadata ────────────────────────────────────────────────────────────
+
+def images_missing_meta(include_failed: bool = False) -> list[tuple[str, int, list[str]]]:
+    """Return (table, row id, urls) for every row with images that have no metadata yet.
+
+    Images whose description already failed (stored as {}) are only included
+    with `include_failed`.
+    """
+    missing = []
+    with get_db() as conn:
+        for table in ("projects", "real_estate"):
+            for row in conn.execute(f"SELECT id, images, image_meta FROM {table}").fetchall():
+                meta = json.loads(row["image_meta"] or "{}")
+                urls = [
+                    url for url in json.loads(row["images"] or "[]")
+                    if url not in meta or (include_failed and not meta[url])
+                ]
+                if urls:
+                    missing.append((table, row["id"], urls))
+    return missing
+
+
+def add_image_meta(table: str, row_id: int, image_meta: dict) -> None:
+    """Merge computed metadata into a row, ignoring images it no longer has.
+
+    Derived data only: the row version is left alone so it never makes an
+    admin's open edit form stale.
+    """
+    with get_db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(f"SELECT images, image_meta FROM {table} WHERE id = ?", (row_id,)).fetchone()
+        if row is None:
+            return
+        images = json.loads(row["images"] or "[]")
+        meta = json.loads(row["image_meta"] or "{}")
+        meta.update({url: info for url, info in image_meta.items() if url in images})
+        conn.execute(f"UPDATE {table} SET image_meta = ? WHERE id = ?", (json.dumps(meta), row_id))
+        _bump_content(conn)
+
+
+# ── Content snapshot ──────────────────────────────────────────────────────────
+
+def _bump_content(conn: sqlite3.Connection) -> None:
+    conn.execute("UPDATE content_changes SET counter = counter + 1 WHERE id = 1")
+
+
+def get_content_counter() -> int:
+    with get_db() as conn:
+        return conn.execute("SELECT counter FROM content_changes WHERE id = 1").fetchone()["counter"]
+
+
+def load_content() -> tuple[int, list[ProjectRow], list[ListingRow]]:
+    """Read the change counter and all public rows from one consistent read transaction."""
+    with get_db() as conn:
+        conn.execute("BEGIN")
+        counter = conn.execute("SELECT counter FROM content_changes WHERE id = 1").fetchone()["counter"]
+        projects = list(_query(conn, ProjectRow, "SELECT * FROM projects ORDER BY created_at DESC"))
+        listings = list(_query(conn, ListingRow, "SELECT * FROM real_estate ORDER BY listing_type, created_at DESC"))
+    return counter, projects, listings
+
+
+# ── Uploads ───────────────────────────────────────────────────────────────────
+
+def upload_name(url: str) -> str | None:
+    """Return the uploads-folder file name an image URL points at, if any."""
+    if url.startswith(UPLOAD_URL_PREFIX):
+        name = url[len(UPLOAD_URL_PREFIX):]
+        if name and "/" not in name:
+            return name
+    return None
+
+
+def _sync_refs(conn: sqlite3.Connection, table: str, row_id: int, images: list[str]) -> None:
+    """Point the reference index for one row at `images`, flagging uploads left unreferenced."""
+    new = {name for name in map(upload_name, images) if name}
+    old = {r["name"] for r in conn.execute(
+        "SELECT name FROM upload_refs WHERE table_name = ? AND row_id = ?", (table, row_id)
+    ).fetchall()}
+
+    for name in new - old:
+        conn.execute("INSERT INTO upload_refs (name, table_name, row_id) VALUES (?, ?, ?)", (name, table, row_id))
+        conn.execute("UPDATE uploads SET orphaned_at = NULL WHERE name = ?", (name,))
+
+    now = time.time()
+    for name in old - new:
         conn.execute(
-            """UPDATE real_estate
-               SET listing_type=?, place=?, title=?, rooms=?, floor=?, price_chf=?,
-                   price_label=?, description=?, bullets=?, images=?
-               WHERE id=?""",
-            (listing_type, place, title, rooms, floor, price_chf, price_label, description,
-             json.dumps(bullets, ensure_ascii=False), json.dumps(images, ensure_ascii=False), listing_id),
+            "DELETE FROM upload_refs WHERE name = ? AND table_name = ? AND row_id = ?", (name, table, row_id)
+        )
+        conn.execute(
+            """UPDATE uploads SET orphaned_at = ?
+               WHERE name = ? AND orphaned_at IS NULL
+                 AND NOT EXISTS (SELECT 1 FROM upload_refs WHERE upload_refs.name = uploads.name)""",
+            (now, name),
         )
 
 
-def delete_listing(listing_id: int) -> None:
+def register_upload(name: str, size: int) -> None:
+    """Record a freshly saved upload. It counts as orphaned until a row references it."""
     with get_db() as conn:
-        conn.execute("DELETE FROM real_estate WHERE id = ?", (listing_id,))
+        conn.execute(
+            """INSERT OR IGNORE INTO uploads (name, size, orphaned_at)
+               SELECT ?, ?, CASE WHEN EXISTS (SELECT 1 FROM upload_refs WHERE name = ?) THEN NULL ELSE ? END""",
+            (name, size, name, time.time()),
+        )
+
+
+def is_registered_upload(name: str) -> bool:
+    with get_db() as conn:
+        return conn.execute("SELECT 1 FROM uploads WHERE name = ?", (name,)).fetchone() is not None
+
+
+def pop_orphaned_uploads(cutoff: float, limit: int) -> list[dict]:
+    """Remove and return up to `limit` uploads that have been unreferenced since before `cutoff`."""
+    with get_db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        rows = conn.execute(
+            "SELECT name, size FROM uploads WHERE orphaned_at <= ? ORDER BY orphaned_at LIMIT ?",
+            (cutoff, limit),
+        ).fetchall()
+        conn.executemany("DELETE FROM uploads WHERE name = ?", [(row["name"],) for row in rows])
+    return rows
 
 
 # ── Seed ──────────────────────────────────────────────────────────────────────
 
 def seed_defaults():
     """Populate the database with default data from site_data.py if tables are empty."""
-    from site_data import PROJECTS, REAL_ESTATE, IMAGES
+    from site_data import PROJECTS, REAL_ESTATE, IMAGES, SEED_IMAGE_META
     import json as _json
 
     with get_db() as conn:
@@ -186,20 +566,27 @@ def seed_defaults():
             for i, p in enumerate(PROJECTS):
                 img = IMAGES["projects"].get(image_keys[i], "") if i < len(image_keys) else ""
                 imgs = [img] if img else []
+                meta = {url: SEED_IMAGE_META[url] for url in imgs if url in SEED_IMAGE_META}
                 conn.execute(
-                    "INSERT INTO projects (title, location, goal, solution, materials, images) VALUES (?, ?, ?, ?, ?, ?)",
-                    (p.title, p.location, p.goal, p.solution, p.materials, _json.dumps(imgs, ensure_ascii=False)),
+                    "INSERT INTO projects (title, location, goal, solution, materials, images, image_meta) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (p.title, p.location, p.goal, p.solution, p.materials, _json.dumps(imgs, ensure_ascii=False),
+                     _json.dumps(meta)),
                 )
+            _bump_content(conn)
 
         count = conn.execute("SELECT COUNT(*) as c FROM real_estate").fetchone()["c"]
         if count == 0:
             for listing in REAL_ESTATE:
+                meta = {url: SEED_IMAGE_META[url] for url in listing.images if url in SEED_IMAGE_META}
                 conn.execute(
                     """INSERT INTO real_estate
-                       (listing_type, place, title, rooms, floor, price_chf, price_label, description, bullets, images)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                       (listing_type, place, title, rooms, floor, price_chf, price_label, description, bullets, images,
+                        image_meta)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                     (listing.listing_type, listing.place, listing.title, listing.rooms,
                      listing.floor, listing.price_chf, listing.price_label, listing.description,
                      _json.dumps(listing.bullets, ensure_ascii=False),
-                     _json.dumps(listing.images, ensure_ascii=False)),
+                     _json.dumps(listing.images, ensure_ascii=False),
+                     _json.dumps(meta)),
                 )
+            _bump_content(conn)
@@ -0,0 +1,122 @@
+"""Intrinsic size and a tiny inline placeholder for each gallery image.
+
+Computed once and stored with the row in its image_meta column as
+{url: {"w": ..., "h": ..., "lqip": "data:image/jpeg;base64,..."}}. Templates
+use it to reserve space and paint a blurred preview while the real image
+lazy-loads.
+
+Uploaded files are described inline by the admin routes. Remote URLs (seeded
+rows, pasted links) are only fetched by backfill(), never inside a request.
+An image that could not be described is stored as {} so it is not retried.
+
+Pillow is optional: without it no metadata is produced and images render as
+plain lazy-loaded <img> tags.
+"""
+from __future__ import annotations
+
+import base64
+import io
+import logging
+import os
+import threading
+import urllib.request
+
+import db
+from uploads import UPLOAD_FOLDER
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+PLACEHOLDER_SIZE = 16  # px on the long side; upscaled and blurred by the browser
+FETCH_TIMEOUT = 5
+MAX_FETCH_BYTES = 15 * 1024 * 1024
+
+log = logging.getLogger(__name__)
+
+
+def available() -> bool:
+    return Image is not None
+
+
+def describe(fp) -> dict | None:
+    """Return {"w", "h", "lqip"} for an image file or file-like object, or None."""
+    if Image is None:
+        return None
+    try:
+        with Image.open(fp) as im:
+            width, height = im.size
+            if im.getexif().get(0x0112) in (5, 6, 7, 8):  # EXIF orientation rotates 90°
+                width, height = height, width
+            im.draft("RGB", (PLACEHOLDER_SIZE * 4, PLACEHOLDER_SIZE * 4))  # cheap JPEG downscale
+            thumb = ImageOps.exif_transpose(im).convert("RGB")
+            thumb.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+            buf = io.BytesIO()
+            thumb.save(buf, "JPEG", quality=40)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+    return {
+        "w": width,
+        "h": height,
+        "lqip": "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode("ascii"),
+    }
+
+
+def describe_url(url: str) -> dict | None:
+    """Describe an image by URL: uploads are read from disk, remote URLs fetched."""
+    if Image is None:
+        return None
+    name = db.upload_name(url)
+    if name:
+        return describe(os.path.join(UPLOAD_FOLDER, name))
+    if not url.startswith(("http://", "https://")):
+        return None
+    try:
+        with urllib.request.urlopen(url, timeout=FETCH_TIMEOUT) as resp:
+            data = resp.read(MAX_FETCH_BYTES + 1)
+    except (OSError, ValueError):
+        return None
+    if len(data) > MAX_FETCH_BYTES:
+        return None
+    return describe(io.BytesIO(data))
+
+
+def describe_uploads(urls: list[str]) -> dict[str, dict]:
+    """Describe the images among `urls` that are local uploads; remote ones are left to backfill()."""
+    meta = {}
+    for url in urls:
+        name = db.upload_name(url)
+        info = describe(os.path.join(UPLOAD_FOLDER, name)) if name else None
+        if info:
+            meta[url] = info
+    return meta
+
+
+def backfill(retry_failed: bool = False) -> int:
+    """Compute metadata for every stored image that lacks it. Returns the number described.
+
+    Failures are recorded as {} and skipped next time unless `retry_failed`.
+    """
+    if Image is None:
+        return 0
+    described = 0
+    for table, row_id, urls in db.images_missing_meta(include_failed=retry_failed):
+        meta = {url: describe_url(url) or {} for url in urls}
+        db.add_image_meta(table, row_id, meta)
+        described += sum(1 for info in meta.values() if info)
+    return described
+
+
+def backfill_in_background() -> None:
+    """Run backfill() off the startup path, e.g. right after seeding."""
+    if Image is None:
+        return
+
+    def run():
+        try:
+            backfill()
+        except Exception:
+            log.exception("Image metadata backfill failed")
+
+    threading.Thread(target=run, name="image-meta-backfill", daemon=True).start()
@@ -1,37 +1,29 @@
 from __future__ import annotations
 
-import json
 import os
-import uuid
 from functools import wraps
 
-from flask import Blueprint, flash, redirect, render_template, request, session, url_for
+from flask import Blueprint, current_app, flash, get_flashed_messages, redirect, render_template, request, session, stream_template, url_for
 from werkzeug.security import check_password_hash
 from werkzeug.utils import secure_filename
 
 import db
+import image_meta
+from caching import no_store, purge
+from uploads import allowed_file, save_upload
 
 admin = Blueprint("admin", __name__, url_prefix="/admin")
+admin.after_request(no_store)
 
-IS_VERCEL = bool(os.getenv("VERCEL"))
-if IS_VERCEL:
-    UPLOAD_FOLDER = "/tmp/uploads"
-else:
-    UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static", "uploads")
-ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp"}
 
+def _purge(*keys: str) -> None:
+    """Purge edge copies of the pages showing `keys` after a write.
 
-def _allowed(filename: str) -> bool:
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
-
-
-def _save_upload(file) -> str:
-    """Save an uploaded file and return its path relative to static/."""
-    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-    ext = file.filename.rsplit(".", 1)[1].lower()
-    name = f"{uuid.uuid4().hex}.{ext}"
-    file.save(os.path.join(UPLOAD_FOLDER, name))
-    return f"uploads/{name}"
+    With the content snapshot on, the snapshot watcher purges instead, once
+    the write is actually served (see snapshot.py).
+    """
+    if not current_app.config["CONTENT_SNAPSHOT"]:
+        purge(*keys)
 
 
 def login_required(f):
@@ -80,7 +72,10 @@ def logout():
 def panel():
     projects = db.get_projects()
     listings = db.get_listings()
-    return render_template("admin_panel.html", projects=projects, listings=listings)
+    # The session cookie is written before a streamed body is generated, so pop
+    # the flashes now; the template then reads them from the request cache.
+    get_flashed_messages(with_categories=True)
+    return stream_template("admin_panel.html", projects=projects, listings=listings)
 
 
 # ── Projects CRUD ─────────────────────────────────────────────────────────────
@@ -101,14 +96,15 @@ def project_add():
     images = []
     files = request.files.getlist("images")
     for f in files:
-        if f and f.filename and _allowed(f.filename):
-            images.append(url_for("static", filename=_save_upload(f)))
+        if f and f.filename and allowed_file(f.filename):
+            images.append(url_for("site.upload", name=save_upload(f)))
 
     image_urls = (request.form.get("image_urls") or "").strip()
     if image_urls:
         images.extend([u.strip() for u in image_urls.split("\n") if u.strip()])
 
-    db.create_project(title, location, goal, solution, materials, images)
+    db.create_project(title, location, goal, solution, materials, images, image_meta.describe_uploads(images))
+    _purge("projects")
     flash("Progetto aggiunto.", "success")
     return redirect(url_for("admin.panel") + "#progetti")
 
@@ -116,11 +112,7 @@ def project_add():
 @admin.route("/projects/<int:project_id>/edit", methods=["POST"])
 @login_required
 def project_edit(project_id: int):
-    project = db.get_project(project_id)
-    if not project:
-        flash("Progetto non trovato.", "error")
-        return redirect(url_for("admin.panel") + "#progetti")
-
+    version = request.form.get("version", type=int)
     title = (request.form.get("title") or "").strip()
     location = (request.form.get("location") or "").strip()
     goal = (request.form.get("goal") or "").strip()
@@ -131,27 +123,33 @@ def project_edit(project_id: int):
         flash("Compila tutti i campi obbligatori.", "error")
         return redirect(url_for("admin.panel") + "#progetti")
 
-    images = list(project["images"])
     new_images = []
-
     files = request.files.getlist("images")
     for f in files:
-        if f and f.filename and _allowed(f.filename):
-            new_images.append(url_for("static", filename=_save_upload(f)))
-
-    # Put newly uploaded images first so the project cover updates immediately.
-    if new_images:
-        images = new_images + images
+        if f and f.filename and allowed_file(f.filename):
+            new_images.append(url_for("site.upload", name=save_upload(f)))
 
     image_urls = (request.form.get("image_urls") or "").strip()
-    if image_urls:
-        images.extend([u.strip() for u in image_urls.split("\n") if u.strip()])
+    url_images = [u.strip() for u in image_urls.split("\n") if u.strip()]
+
+    fields = {"title": title, "location": location, "goal": goal, "solution": solution, "materials": materials}
+    try:
+        # Put newly uploaded images first so the project cover updates immediately.
+        found = db.patch_project(
+            project_id, version, fields,
+            prepend_images=new_images, append_images=url_images,
+            remove_images=request.form.getlist("remove_images"),
+            image_meta=image_meta.describe_uploads(new_images + url_images),
+        )
+    except db.StaleVersionError:
+        flash("Il progetto è stato modificato nel frattempo. Ricarica e riprova.", "error")
+        return redirect(url_for("admin.panel") + "#progetti")
 
-    remove_images = request.form.getlist("remove_images")
-    if remove_images:
-        images = [img for img in images if img not in remove_images]
+    if not found:
+        flash("Progetto non trovato.", "error")
+        return redirect(url_for("admin.panel") + "#progetti")
 
-    db.update_project(project_id, title, location, goal, solution, materials, images)
+    _purge("projects")
     flash("Progetto aggiornato.", "success")
     return redirect(url_for("admin.panel") + "#progetti")
 
@@ -160,6 +158,7 @@ def project_edit(project_id: int):
 @login_required
 def project_delete(project_id: int):
     db.delete_project(project_id)
+    _purge("projects")
     flash("Progetto eliminato.", "success")
     return redirect(url_for("admin.panel") + "#progetti")
 
@@ -194,14 +193,18 @@ def listing_add():
     images = []
     files = request.files.getlist("images")
     for f in files:
-        if f and f.filename and _allowed(f.filename):
-            images.append(url_for("static", filename=_save_upload(f)))
+        if f and f.filename and allowed_file(f.filename):
+            images.append(url_for("site.upload", name=save_upload(f)))
 
     image_urls = (request.form.get("image_urls") or "").strip()
     if image_urls:
         images.extend([u.strip() for u in image_urls.split("\n") if u.strip()])
 
-    db.create_listing(listing_type, place, title, rooms, floor, price_chf, price_label, description, bullets, images)
+    db.create_listing(
+        listing_type, place, title, rooms, floor, price_chf, price_label, description, bullets, images,
+        image_meta.describe_uploads(images),
+    )
+    _purge("listings")
     flash("Immobile aggiunto.", "success")
     return redirect(url_for("admin.panel") + "#immobili")
 
@@ -209,11 +212,7 @@ def listing_add():
 @admin.route("/listings/<int:listing_id>/edit", methods=["POST"])
 @login_required
 def listing_edit(listing_id: int):
-    listing = db.get_listing(listing_id)
-    if not listing:
-        flash("Immobile non trovato.", "error")
-        return redirect(url_for("admin.panel") + "#immobili")
-
+    version = request.form.get("version", type=int)
     listing_type = (request.form.get("listing_type") or "").strip()
     place = (request.form.get("place") or "").strip()
     title = (request.form.get("title") or "").strip()
@@ -236,27 +235,36 @@ def listing_edit(listing_id: int):
 
     bullets = [b.strip() for b in bullets_raw.split("\n") if b.strip()]
 
-    images = list(listing["images"])
     new_images = []
-
     files = request.files.getlist("images")
     for f in files:
-        if f and f.filename and _allowed(f.filename):
-            new_images.append(url_for("static", filename=_save_upload(f)))
-
-    # Keep behavior aligned with projects: latest upload becomes first image.
-    if new_images:
-        images = new_images + images
+        if f and f.filename and allowed_file(f.filename):
+            new_images.append(url_for("site.upload", name=save_upload(f)))
 
     image_urls = (request.form.get("image_urls") or "").strip()
-    if image_urls:
-        images.extend([u.strip() for u in image_urls.split("\n") if u.strip()])
+    url_images = [u.strip() for u in image_urls.split("\n") if u.strip()]
+
+    fields = {
+        "listing_type": listing_type, "place": place, "title": title, "rooms": rooms, "floor": floor,
+        "price_chf": price_chf, "price_label": price_label, "description": description, "bullets": bullets,
+    }
+    try:
+        # Keep behavior aligned with projects: latest upload becomes first image.
+        found = db.patch_listing(
+            listing_id, version, fields,
+            prepend_images=new_images, append_images=url_images,
+            remove_images=request.form.getlist("remove_images"),
+            image_meta=image_meta.describe_uploads(new_images + url_images),
+        )
+    except db.StaleVersionError:
+        flash("L'immobile è stato modificato nel frattempo. Ricarica e riprova.", "error")
+        return redirect(url_for("admin.panel") + "#immobili")
 
-    remove_images = request.form.getlist("remove_images")
-    if remove_images:
-        images = [img for img in images if img not in remove_images]
+    if not found:
+        flash("Immobile non trovato.", "error")
+        return redirect(url_for("admin.panel") + "#immobili")
 
-    db.update_listing(listing_id, listing_type, place, title, rooms, floor, price_chf, price_label, description, bullets, images)
+    _purge("listings")
     flash("Immobile aggiornato.", "success")
     return redirect(url_for("admin.panel") + "#immobili")
 
@@ -265,5 +273,6 @@ def listing_edit(listing_id: int):
 @login_required
 def listing_delete(listing_id: int):
     db.delete_listing(listing_id)
+    _purge("listings")
     flash("Immobile eliminato.", "success")
     return redirect(url_for("admin.panel") + "#immobili")
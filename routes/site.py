@@ -1,40 +1,91 @@
-from flask import Blueprint, render_template, request
+import mimetypes
+import os
+
+from flask import Blueprint, Response, abort, current_app, render_template, request, send_from_directory, stream_template
+from werkzeug.security import safe_join
 
 import db
+import snapshot
+from caching import apply_policy, cache_policy
 from site_data import ABOUT, PRODUCTS, SERVICES, COMPANY, IMAGES
+from uploads import UPLOAD_FOLDER, allowed_file
+
+# Upload names are random and never reused, so clients may cache them forever.
+UPLOAD_MAX_AGE = 365 * 24 * 3600
+
+
+# Edge caches hold pages for up to a day; admin writes purge them by key.
+PAGE_TTL = dict(max_age=300, s_maxage=86400, stale_while_revalidate=86400)
+LISTING_TTL = dict(max_age=60, s_maxage=3600, stale_while_revalidate=86400)
 
 site = Blueprint("site", __name__)
+site.after_request(apply_policy)
+
+
+def _content():
+    """Read backend for public pages: the in-memory snapshot when enabled, else the database."""
+    return snapshot if current_app.config["CONTENT_SNAPSHOT"] else db
 
 
 @site.get("/")
+@cache_policy(**LISTING_TTL, surrogate_keys=("projects",))
 def home():
-    projects = db.get_projects()[:3]
+    projects = _content().get_projects()[:3]
     return render_template("index.html", services=SERVICES[:3], projects=projects, images=IMAGES)
 
 
 @site.get("/about")
+@cache_policy(**PAGE_TTL, surrogate_keys=("pages",))
 def about():
     return render_template("about.html", about=ABOUT)
 
 
 @site.get("/projects")
+@cache_policy(**LISTING_TTL, surrogate_keys=("projects",))
 def projects():
-    project_list = db.get_projects()
-    return render_template("projects.html", projects=project_list, images=IMAGES)
+    # Streamed: the layout head and hero go out before the first row is read.
+    return stream_template("projects.html", projects=_content().iter_projects(), images=IMAGES)
 
 
 @site.get("/products")
+@cache_policy(**PAGE_TTL, surrogate_keys=("pages",))
 def products():
     return render_template("products.html", products=PRODUCTS, images=IMAGES)
 
 
 @site.get("/real-estate")
+@cache_policy(**LISTING_TTL, surrogate_keys=("listings",))
 def real_estate():
-    listings = db.get_listings()
-    return render_template("real_estate.html", listings=listings)
+    counts, (vendita, affitto) = _content().stream_listings(("vendita", "affitto"))
+    return stream_template("real_estate.html", counts=counts, vendita=vendita, affitto=affitto)
+
+
+@site.get("/uploads/<name>")
+def upload(name: str):
+    path = safe_join(UPLOAD_FOLDER, name)
+    if path is None or not allowed_file(name):
+        abort(404)
+
+    accel_prefix = current_app.config.get("UPLOAD_ACCEL_REDIRECT")
+    if accel_prefix:
+        # nginx serves the bytes (including Range) from an internal location.
+        if not os.path.isfile(path):
+            abort(404)
+        response = Response(mimetype=mimetypes.guess_type(name)[0] or "application/octet-stream")
+        response.headers["X-Accel-Redirect"] = f"{accel_prefix.rstrip('/')}/{name}"
+    else:
+        # Handles Range/conditional requests, X-Sendfile when USE_X_SENDFILE is
+        # set, and the server's wsgi.file_wrapper (sendfile) otherwise.
+        response = send_from_directory(UPLOAD_FOLDER, name, max_age=UPLOAD_MAX_AGE)
+
+    response.cache_control.public = True
+    response.cache_control.max_age = UPLOAD_MAX_AGE
+    response.cache_control.immutable = True
+    return response
 
 
 @site.route("/contact", methods=["GET", "POST"])
+@cache_policy(**PAGE_TTL, surrogate_keys=("pages",))  # GET only; POST is always no-store
 def contact():
     success = False
     data = {"name": "", "email": "", "phone": "", "message": ""}
@@ -227,10 +227,10 @@ REAL_ESTATE: list[RealEstateListing] = [
             "Ascensore • lavanderia in comune • zona centrale e tranquilla",
         ],
         images=[
-            "https://images.unsplash.com/photo-1502672260266-1c1ef2d93688?auto=format&fit=crop&w=1200&q=80",
-            "https://images.unsplash.com/photo-1560448204-e02f11c3d0e2?auto=format&fit=crop&w=1200&q=80",
-            "https://images.unsplash.com/photo-1556909114-f6e7ad7d3136?auto=format&fit=crop&w=1200&q=80",
-            "https://images.unsplash.com/photo-1560185893-a55cbc8c57e8?auto=format&fit=crop&w=1200&q=80",
+            "https://images.unsplash.com/photo-1502672260266-1c1ef2d93688?auto=format&fit=crop&w=1200&h=900&q=80",
+            "https://images.unsplash.com/photo-1560448204-e02f11c3d0e2?auto=format&fit=crop&w=1200&h=900&q=80",
+            "https://images.unsplash.com/photo-1556909114-f6e7ad7d3136?auto=format&fit=crop&w=1200&h=900&q=80",
+            "https://images.unsplash.com/photo-1560185893-a55cbc8c57e8?auto=format&fit=crop&w=1200&h=900&q=80",
         ],
     ),
     RealEstateListing(
@@ -248,9 +248,9 @@ REAL_ESTATE: list[RealEstateListing] = [
         ),
         bullets=["Pigione mensile Fr. 1'100.–", "Acconto spese accessorie Fr. 200.–", "Posteggio esterno Fr. 50.–"],
         images=[
-            "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?auto=format&fit=crop&w=1200&q=80",
-            "https://images.unsplash.com/photo-1560185007-cde436f6a4d0?auto=format&fit=crop&w=1200&q=80",
-            "https://images.unsplash.com/photo-1484154218962-a197022b25ba?auto=format&fit=crop&w=1200&q=80",
+            "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?auto=format&fit=crop&w=1200&h=900&q=80",
+            "https://images.unsplash.com/photo-1560185007-cde436f6a4d0?auto=format&fit=crop&w=1200&h=900&q=80",
+            "https://images.unsplash.com/photo-1484154218962-a197022b25ba?auto=format&fit=crop&w=1200&h=900&q=80",
         ],
     ),
     # ─── IN VENDITA ───────────────────────────────────────────────────────────────
@@ -276,10 +276,10 @@ REAL_ESTATE: list[RealEstateListing] = [
             "Libero subito",
         ],
         images=[
-            "https://images.unsplash.com/photo-1600596542815-ffad4c1539a9?auto=format&fit=crop&w=1200&q=80",
-            "https://images.unsplash.com/photo-1600585154340-be6161a56a0c?auto=format&fit=crop&w=1200&q=80",
-            "https://images.unsplash.com/photo-1600607687939-ce8a6c25118c?auto=format&fit=crop&w=1200&q=80",
-            "https://images.unsplash.com/photo-1560440021-33f9b867899d?auto=format&fit=crop&w=1200&q=80",
+            "https://images.unsplash.com/photo-1600596542815-ffad4c1539a9?auto=format&fit=crop&w=1200&h=900&q=80",
+            "https://images.unsplash.com/photo-1600585154340-be6161a56a0c?auto=format&fit=crop&w=1200&h=900&q=80",
+            "https://images.unsplash.com/photo-1600607687939-ce8a6c25118c?auto=format&fit=crop&w=1200&h=900&q=80",
+            "https://images.unsplash.com/photo-1560440021-33f9b867899d?auto=format&fit=crop&w=1200&h=900&q=80",
         ],
     ),
 ]
@@ -294,9 +294,30 @@ IMAGES = {
         "porte": "https://images.unsplash.com/photo-1600585154340-be6161a56a0c?auto=format&fit=crop&w=1600&q=80",
     },
     "projects": {
-        "cucina": "https://images.unsplash.com/photo-1556912172-45b7abe8b7e1?auto=format&fit=crop&w=1600&q=80",
-        "portoncino": "https://images.unsplash.com/photo-1520607162513-77705c0f0d4a?auto=format&fit=crop&w=1600&q=80",
-        "armadio": "https://images.unsplash.com/photo-1618221195710-dd6b41faaea6?auto=format&fit=crop&w=1600&q=80",
+        "cucina": "https://images.unsplash.com/photo-1556912172-45b7abe8b7e1?auto=format&fit=crop&w=1600&h=1200&q=80",
+        "portoncino": "https://images.unsplash.com/photo-1520607162513-77705c0f0d4a?auto=format&fit=crop&w=1600&h=1200&q=80",
+        "armadio": "https://images.unsplash.com/photo-1618221195710-dd6b41faaea6?auto=format&fit=crop&w=1600&h=1200&q=80",
     },
 }
 
+
+# Size of the seeded gallery images (and, once generated, their blurred
+# placeholder) in image_meta's format, so seed_defaults() stores them without
+# fetching anything at startup. The URLs pin w and h, so the sizes are exact.
+# After changing a seed image, regenerate with `flask image-meta --seed`.
+SEED_IMAGE_META: dict[str, dict] = {
+    "https://images.unsplash.com/photo-1502672260266-1c1ef2d93688?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1560448204-e02f11c3d0e2?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1556909114-f6e7ad7d3136?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1560185893-a55cbc8c57e8?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1560185007-cde436f6a4d0?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1484154218962-a197022b25ba?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1600596542815-ffad4c1539a9?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1600585154340-be6161a56a0c?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1600607687939-ce8a6c25118c?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1560440021-33f9b867899d?auto=format&fit=crop&w=1200&h=900&q=80": {"w": 1200, "h": 900},
+    "https://images.unsplash.com/photo-1556912172-45b7abe8b7e1?auto=format&fit=crop&w=1600&h=1200&q=80": {"w": 1600, "h": 1200},
+    "https://images.unsplash.com/photo-1520607162513-77705c0f0d4a?auto=format&fit=crop&w=1600&h=1200&q=80": {"w": 1600, "h": 1200},
+    "https://images.unsplash.com/photo-1618221195710-dd6b41faaea6?auto=format&fit=crop&w=1600&h=1200&q=80": {"w": 1600, "h": 1200},
+}
@@ -0,0 +1,154 @@
+"""Optional in-memory copy of the public content (CONTENT_SNAPSHOT=1).
+
+Each worker keeps an immutable, pre-indexed Snapshot of every project and
+listing. A daemon thread polls the change counter that the db write functions
+bump, rebuilds the snapshot off the request path when it moves, and swaps the
+module-level reference in one assignment. Public reads never touch SQLite and
+never wait on a writer; they may lag an admin edit by up to the poll interval.
+
+The watcher is started lazily by the first read in each process, so it also
+runs in workers forked from a preloaded app (gunicorn --preload), where a
+thread started in the parent would not survive the fork.
+
+Edge caches must not be purged before the new content is served, or they
+would refill with the old page. So with the snapshot on, purging happens in
+on_change, called by each worker's watcher after it swaps; the purge from the
+last worker to swap follows the last stale copy.
+
+The read functions mirror their db counterparts so routes can use either.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import db
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    counter: int
+    projects: tuple[db.ProjectRow, ...]  # newest first
+    projects_by_id: Mapping[int, db.ProjectRow]
+    listings: tuple[db.ListingRow, ...]  # by listing_type, then newest first
+    listings_by_id: Mapping[int, db.ListingRow]
+    listings_by_type: Mapping[str, tuple[db.ListingRow, ...]]
+
+
+_current: Snapshot | None = None
+_poll_interval = DEFAULT_POLL_INTERVAL
+_on_change: Callable[[], None] | None = None
+_watcher_pid: int | None = None
+_watcher_lock = threading.Lock()
+
+
+def _build() -> Snapshot:
+    counter, projects, listings = db.load_content()
+    # Decode the lazy JSON fields now so readers never write to shared rows.
+    for project in projects:
+        project.images
+        project.image_meta
+    for listing in listings:
+        listing.bullets
+        listing.images
+        listing.image_meta
+
+    by_type: dict[str, list[db.ListingRow]] = {"vendita": [], "affitto": []}
+    for listing in listings:
+        by_type.setdefault(listing.listing_type, []).append(listing)
+
+    return Snapshot(
+        counter=counter,
+        projects=tuple(projects),
+        projects_by_id=MappingProxyType({p.id: p for p in projects}),
+        listings=tuple(listings),
+        listings_by_id=MappingProxyType({l.id: l for l in listings}),
+        listings_by_type=MappingProxyType({t: tuple(rows) for t, rows in by_type.items()}),
+    )
+
+
+def refresh() -> bool:
+    """Rebuild and swap in a new snapshot if the content changed. Returns True if swapped."""
+    global _current
+    if _current is not None and db.get_content_counter() == _current.counter:
+        return False
+    _current = _build()
+    return True
+
+
+def _watch() -> None:
+    while True:
+        time.sleep(_poll_interval)
+        try:
+            if refresh() and _on_change is not None:
+                _on_change()
+        except Exception:
+            log.exception("Content snapshot refresh failed; keeping the previous one")
+
+
+def start(poll_interval: float = DEFAULT_POLL_INTERVAL, on_change: Callable[[], None] | None = None) -> None:
+    """Build the first snapshot; the watcher thread follows on the first read.
+
+    `on_change` is called from the watcher after each later swap.
+    """
+    global _poll_interval, _on_change
+    _poll_interval = poll_interval
+    _on_change = on_change
+    refresh()
+
+
+def _ensure_watcher() -> None:
+    """Start the watcher thread once per process (again after a fork)."""
+    global _watcher_pid
+    pid = os.getpid()
+    if _watcher_pid == pid:
+        return
+    with _watcher_lock:
+        if _watcher_pid == pid:
+            return
+        threading.Thread(target=_watch, name="content-snapshot", daemon=True).start()
+        _watcher_pid = pid
+
+
+def current() -> Snapshot:
+    if _current is None:
+        raise RuntimeError("Content snapshot not started")
+    _ensure_watcher()
+    return _current
+
+
+# ── Read API (mirrors db) ─────────────────────────────────────────────────────
+
+def get_projects() -> tuple[db.ProjectRow, ...]:
+    return current().projects
+
+
+def iter_projects() -> Iterator[db.ProjectRow]:
+    return iter(current().projects)
+
+
+def get_project(project_id: int) -> db.ProjectRow | None:
+    return current().projects_by_id.get(project_id)
+
+
+def get_listings() -> tuple[db.ListingRow, ...]:
+    return current().listings
+
+
+def stream_listings(listing_types: tuple[str, ...]) -> tuple[dict[str, int], list[Iterator[db.ListingRow]]]:
+    by_type = current().listings_by_type
+    rows = [by_type.get(t, ()) for t in listing_types]
+    return dict(zip(listing_types, map(len, rows))), [iter(r) for r in rows]
+
+
+def get_listing(listing_id: int) -> db.ListingRow | None:
+    return current().listings_by_id.get(listing_id)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+import uuid
+
+import db
+
+IS_VERCEL = bool(os.getenv("VERCEL"))
+if IS_VERCEL:
+    UPLOAD_FOLDER = "/tmp/uploads"
+else:
+    UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), "static", "uploads")
+ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp"}
+
+# How long an unreferenced upload is kept before the sweeper may delete it.
+# Covers the window between saving a file and committing the row that uses it.
+GRACE_PERIOD = 24 * 3600
+
+log = logging.getLogger(__name__)
+
+
+def allowed_file(filename: str) -> bool:
+    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+
+
+def save_upload(file) -> str:
+    """Save an uploaded file and return its name, to be served by site.upload."""
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+    ext = file.filename.rsplit(".", 1)[1].lower()
+    name = f"{uuid.uuid4().hex}.{ext}"
+    path = os.path.join(UPLOAD_FOLDER, name)
+    file.save(path)
+    db.register_upload(name, os.path.getsize(path))
+    return name
+
+
+def sweep(grace_period: float = GRACE_PERIOD, batch_size: int = 500) -> tuple[int, int]:
+    """Delete uploads that have been unreferenced for longer than `grace_period` seconds.
+
+    Candidates come from the uploads table, so the folder itself is never
+    walked. A file that cannot be removed is put back in the table, with a
+    fresh grace period, so a later sweep retries it. Returns (files removed,
+    bytes freed).
+    """
+    cutoff = time.time() - grace_period
+    removed = freed = 0
+    while True:
+        batch = db.pop_orphaned_uploads(cutoff, batch_size)
+        for row in batch:
+            try:
+                os.remove(os.path.join(UPLOAD_FOLDER, row["name"]))
+            except FileNotFoundError:
+                continue
+            except OSError:
+                log.exception("Could not remove upload %s; will retry", row["name"])
+                db.register_upload(row["name"], row["size"])
+                continue
+            removed += 1
+            freed += row["size"]
+        if len(batch) < batch_size:
+            return removed, freed
+
+
+def rescan() -> int:
+    """Register files already on disk that the uploads table does not know about.
+
+    This is the only operation that walks the folder; run it once after
+    upgrading or after copying files in by hand. Returns the number added.
+    """
+    if not os.path.isdir(UPLOAD_FOLDER):
+        return 0
+    added = 0
+    with os.scandir(UPLOAD_FOLDER) as entries:
+        for entry in entries:
+            if entry.is_file() and allowed_file(entry.name) and not db.is_registered_upload(entry.name):
+                db.register_upload(entry.name, entry.stat().st_size)
+                added += 1
+    return added